@@ -1,12 +1,17 @@
+import sys
+
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from rental_loader import load_rents
+
 pd.options.display.float_format = '{:,.0f}'.format
 
-df = pd.read_csv(r".\korea_rental_housing.csv", encoding="cp949")
-#다운로드 한 데이터를 절대경로를 이용해 가져옴
+data_path = sys.argv[1] if len(sys.argv) > 1 else "korea_rental_housing.csv"   # 데이터 경로는 인자로 받음
 
-df_seoul = df[df['광역시도'] == '서울특별시']      #전국의 지역 중 서울특별시
+# 광역시도/월임대료 두 컬럼만, 서울특별시만 골라서 읽음 (월임대료 결측 행도 그대로 출력)
+provinces, rents = load_rents(data_path, provinces=['서울특별시'], return_provinces=True, dropna=False)
+df_seoul = pd.DataFrame({'광역시도': provinces, '월임대료': rents})      #전국의 지역 중 서울특별시
 df_monthly_rent = df_seoul['월임대료'].describe()  # 서울 임대료 통계량 보기
 
 print(df_seoul[['광역시도', '월임대료']])       # 서울 지역과 임대료만 출력
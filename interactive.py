@@ -0,0 +1,271 @@
+import os
+import sys
+import time
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.transforms import Bbox
+from matplotlib.widgets import Slider
+from scipy import stats
+
+from quantile_ci import quantile_ci
+from rental_loader import load_rents
+
+# 기본값은 각 프로젝트 스크립트와 같게 둔다
+n_samples = 1200          # zdep_project5/6 모집단 크기
+mu1, mu2 = 50, 70
+sigma = 10
+n1, n2 = 81, 101
+confidence_level = 0.95
+sample_size = 100         # project3
+alpha = 0.01
+
+
+class PrefixStats:
+    """한 번 섞어 둔 모집단과 그 누적합/누적제곱합.
+
+    섞인 배열의 앞 n 개는 크기 n 인 비복원 단순임의표본이므로, 표본평균과 표본분산을
+    누적합 두 개로 O(1)에 구할 수 있다. 누적합은 모집단 평균을 빼고 쌓아서 큰 값
+    (월임대료)에서도 분산 계산이 상쇄 오차에 덜 민감하게 한다.
+    """
+
+    def __init__(self, population, seed):
+        self.sample = np.random.default_rng(seed).permutation(np.asarray(population, dtype=float))
+        self.shift = self.sample.mean()
+        centered = self.sample - self.shift
+        self._sum = np.concatenate([[0.0], np.cumsum(centered)])
+        self._sq = np.concatenate([[0.0], np.cumsum(centered ** 2)])
+
+    def __len__(self):
+        return self.sample.size
+
+    def mean_var(self, n):
+        s, q = self._sum[n], self._sq[n]
+        return self.shift + s / n, (q - s * s / n) / (n - 1)
+
+
+def two_sample_intervals(stats1, stats2, n1, n2, confidence_level):
+    """zdep_project5/6 의 구간들: 평균 차이(x̄₂ - x̄₁) 세 가지와 분산비(s₁²/s₂²).
+
+    반환값: 이름 -> (하한, 추정값, 상한)
+    """
+    a = 1 - confidence_level
+    m1, v1 = stats1.mean_var(n1)
+    m2, v2 = stats2.mean_var(n2)
+    diff = m2 - m1
+
+    known = stats.norm.ppf(1 - a / 2) * sigma * np.sqrt(1 / n1 + 1 / n2)
+    pooled_var = ((n1 - 1) * v1 + (n2 - 1) * v2) / (n1 + n2 - 2)
+    pooled = stats.t.ppf(1 - a / 2, n1 + n2 - 2) * np.sqrt(pooled_var * (1 / n1 + 1 / n2))
+    se_welch = np.sqrt(v1 / n1 + v2 / n2)
+    df_welch = se_welch ** 4 / ((v1 / n1) ** 2 / (n1 - 1) + (v2 / n2) ** 2 / (n2 - 1))
+    welch = stats.t.ppf(1 - a / 2, df_welch) * se_welch
+
+    ratio = v1 / v2
+    f_lower = stats.f.ppf(a / 2, n1 - 1, n2 - 1)
+    f_upper = stats.f.ppf(1 - a / 2, n1 - 1, n2 - 1)
+    return {
+        "Known Variance": (diff - known, diff, diff + known),
+        "Equal Unknown": (diff - pooled, diff, diff + pooled),
+        "Unequal Unknown": (diff - welch, diff, diff + welch),
+        "Variance Ratio": (ratio / f_upper, ratio, ratio / f_lower),
+    }
+
+
+def rent_intervals(rent_stats, size, alpha):
+    """project3 의 구간들: 모평균, 중앙값(순서통계량), 향후 관측값 예측구간 + 모분산."""
+    mean, var = rent_stats.mean_var(size)
+    t_crit = stats.t.ppf(1 - alpha / 2, size - 1)
+    mean_margin = t_crit * np.sqrt(var / size)
+    pred_margin = t_crit * np.sqrt(var * (1 + 1 / size))
+    median = quantile_ci(rent_stats.sample[:size], 0.5, alpha)
+    chi2_lower = stats.chi2.ppf(alpha / 2, size - 1)
+    chi2_upper = stats.chi2.ppf(1 - alpha / 2, size - 1)
+    return {
+        "Mean": (mean - mean_margin, mean, mean + mean_margin),
+        "Median": (median["lower"], median["estimate"], median["upper"]),
+        "Prediction": (mean - pred_margin, mean, mean + pred_margin),
+        "Variance": ((size - 1) * var / chi2_upper, var, (size - 1) * var / chi2_lower),
+    }
+
+
+class IntervalPanel:
+    """구간 여러 개를 한 축에 가로 막대로 그리는 패널 — 막대와 글자는 blit 용 animated 아티스트."""
+
+    def __init__(self, ax, names, title, xlabel, reference=None):
+        self.ax = ax
+        self.names = names
+        self.reference = reference
+        y = np.arange(len(names))
+        self.bars = [ax.plot([], [], "-|", color="tab:blue", lw=2, ms=12, animated=True)[0] for _ in names]
+        self.dots = [ax.plot([], [], "o", color="tab:green", animated=True)[0] for _ in names]
+        self.label = ax.text(0.01, 0.98, "", transform=ax.transAxes, va="top", fontsize=8,
+                             family="monospace", animated=True)
+        if reference is not None:
+            ax.axvline(reference, color="red", linestyle="--", label=f"True value: {reference}")
+            ax.legend(loc="lower right")
+        ax.set_yticks(y)
+        ax.set_yticklabels(names)
+        ax.set_ylim(-0.7, len(names) - 0.3)
+        ax.set_title(title)
+        ax.set_xlabel(xlabel)
+        ax.grid(True, alpha=0.3)
+
+    @property
+    def artists(self):
+        return self.bars + self.dots + [self.label]
+
+    def update(self, intervals, fmt):
+        """막대를 새 구간으로 옮긴다.
+
+        구간이 축 범위를 벗어나거나 범위의 1/4 보다 좁아지면 범위를 구간(과 참값)에 맞춰 다시
+        잡고 False(전체 다시 그리기 필요)를 돌려준다.
+        """
+        lines = []
+        for i, name in enumerate(self.names):
+            lower, estimate, upper = intervals[name]
+            self.bars[i].set_data([lower, upper], [i, i])
+            self.dots[i].set_data([estimate], [i])
+            lines.append(f"{name:<16}[{lower:{fmt}}, {upper:{fmt}}]")
+        self.label.set_text("\n".join(lines))
+
+        bounds = [value for name in self.names for value in (intervals[name][0], intervals[name][2])]
+        if self.reference is not None:
+            bounds.append(self.reference)
+        low, high = min(bounds), max(bounds)
+        x0, x1 = self.ax.get_xlim()
+        if x0 <= low and high <= x1 and high - low >= 0.25 * (x1 - x0):
+            return True
+        margin = 0.1 * (high - low) or 0.1 * (abs(high) or 1.0)
+        self.ax.set_xlim(low - margin, high + margin)
+        return False
+
+
+class Explorer:
+    """데이터와 누적 통계량은 한 번만 준비하고, 슬라이더가 바뀌면 해당 패널만 다시 계산해 blit 한다."""
+
+    def __init__(self, data_path=None):
+        # 모집단 생성 / CSV 읽기는 여기서 한 번만
+        np.random.seed(42)
+        population1 = np.random.normal(mu1, sigma, n_samples)
+        population2 = np.random.normal(mu2, sigma, n_samples)
+        self.stats1 = PrefixStats(population1, seed=123)
+        self.stats2 = PrefixStats(population2, seed=456)
+        self.rent_stats = None
+        if data_path is not None:
+            self.rent_stats = PrefixStats(load_rents(data_path, provinces=['서울특별시']), seed=42)
+
+        rows = 3 if self.rent_stats is not None else 2
+        self.fig = plt.figure(figsize=(14, 4 * rows))
+        grid = self.fig.add_gridspec(rows, 2, height_ratios=[3] * (rows - 1) + [1.2], hspace=0.5)
+        self.diff_panel = IntervalPanel(self.fig.add_subplot(grid[0, 0]),
+                                        ["Known Variance", "Equal Unknown", "Unequal Unknown"],
+                                        "Confidence Intervals for μ₂ - μ₁", "Difference in Means",
+                                        reference=mu2 - mu1)
+        self.ratio_panel = IntervalPanel(self.fig.add_subplot(grid[0, 1]), ["Variance Ratio"],
+                                         "Confidence Interval for σ₁²/σ₂²", "Variance Ratio",
+                                         reference=1.0)
+        self.rent_panel = None
+        if self.rent_stats is not None:
+            self.rent_panel = IntervalPanel(self.fig.add_subplot(grid[1, :]), ["Mean", "Median", "Prediction"],
+                                            "Seoul Monthly Rent", "Monthly rent")
+
+        # 슬라이더 — 그리기는 직접 blit 하므로 drawon 은 끈다
+        slider_grid = grid[rows - 1, :].subgridspec(5, 1, hspace=0.8)
+        self.sliders = {}
+        self._add_slider(slider_grid[0], "n1", 5, n_samples, n1, self._update_two_sample, step=1)
+        self._add_slider(slider_grid[1], "n2", 5, n_samples, n2, self._update_two_sample, step=1)
+        self._add_slider(slider_grid[2], "confidence_level", 0.5, 0.999, confidence_level,
+                         self._update_two_sample)
+        if self.rent_stats is not None:
+            self._add_slider(slider_grid[3], "sample_size", 10, len(self.rent_stats), sample_size,
+                             self._update_rent, step=1)
+            self._add_slider(slider_grid[4], "alpha", 0.001, 0.5, alpha, self._update_rent)
+
+        # 갱신 한 번(계산 + blit)에 걸린 시간 — 100 ms 안쪽인지 화면에서 바로 확인
+        self.timing = self.fig.text(0.99, 0.005, "", ha="right", va="bottom", fontsize=8, animated=True)
+        self.background = None
+        self.fig.canvas.mpl_connect("draw_event", self._on_draw)
+        self._update_two_sample(blit=False)
+        if self.rent_stats is not None:
+            self._update_rent(blit=False)
+
+    def _add_slider(self, cell, name, valmin, valmax, valinit, callback, step=None):
+        slider = Slider(self.fig.add_subplot(cell), name, valmin, valmax, valinit=valinit, valstep=step)
+        slider.drawon = False
+        slider.valtext.set_animated(True)
+        slider.on_changed(lambda _: callback())
+        self.sliders[name] = slider
+
+    def _panels(self):
+        return [panel for panel in (self.diff_panel, self.ratio_panel, self.rent_panel) if panel is not None]
+
+    def _on_draw(self, event):
+        # 전체 그리기가 끝날 때마다(처음, 창 크기 변경) animated 아티스트를 뺀 배경을 저장해 둔다
+        self.background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        for panel in self._panels():
+            for artist in panel.artists:
+                panel.ax.draw_artist(artist)
+        for slider in self.sliders.values():
+            slider.ax.draw_artist(slider.valtext)
+        self.fig.draw_artist(self.timing)
+
+    def _value(self, name):
+        return self.sliders[name].val
+
+    def _update_two_sample(self, blit=True):
+        start = time.perf_counter()
+        intervals = two_sample_intervals(self.stats1, self.stats2, int(self._value("n1")),
+                                         int(self._value("n2")), self._value("confidence_level"))
+        in_view = self.diff_panel.update(intervals, ".4f") & self.ratio_panel.update(intervals, ".4f")
+        if blit:
+            self._blit([self.diff_panel, self.ratio_panel], ["n1", "n2", "confidence_level"], in_view, start)
+
+    def _update_rent(self, blit=True):
+        start = time.perf_counter()
+        intervals = rent_intervals(self.rent_stats, int(self._value("sample_size")), self._value("alpha"))
+        in_view = self.rent_panel.update(intervals, ",.0f")
+        lower, variance, upper = intervals["Variance"]
+        self.rent_panel.label.set_text(self.rent_panel.label.get_text()
+                                       + f"\n{'Variance':<16}[{lower:,.0f}, {upper:,.0f}]")
+        if blit:
+            self._blit([self.rent_panel], ["sample_size", "alpha"], in_view, start)
+
+    def _blit(self, panels, slider_names, in_view, start):
+        canvas = self.fig.canvas
+        if self.background is None or not in_view:
+            # 아직 한 번도 안 그려졌거나 축 범위가 바뀜 -> 전체 다시 그리기 (배경도 새로 저장됨)
+            self.timing.set_text("update: full redraw (axis range changed)")
+            canvas.draw_idle()
+            return
+        regions = []
+        for panel in panels:
+            canvas.restore_region(self.background, bbox=panel.ax.bbox)
+            for artist in panel.artists:
+                panel.ax.draw_artist(artist)
+            regions.append(panel.ax.bbox)
+        for name in slider_names:
+            slider = self.sliders[name]
+            # 슬라이더 축 + 오른쪽 값 표시 글자까지
+            region = Bbox([[slider.ax.bbox.x0, slider.ax.bbox.y0], [self.fig.bbox.x1, slider.ax.bbox.y1]])
+            canvas.restore_region(self.background, bbox=region)
+            self.fig.draw_artist(slider.ax)
+            slider.ax.draw_artist(slider.valtext)
+            regions.append(region)
+        for region in regions:
+            canvas.blit(region)
+
+        # 걸린 시간은 위 blit 까지 포함해서 잰 뒤 글자 영역만 따로 한 번 더 blit 한다
+        self.timing.set_text(f"update: {(time.perf_counter() - start) * 1000:.1f} ms")
+        region = Bbox(self.fig.transFigure.transform([[0.7, 0.0], [1.0, 0.03]]))
+        canvas.restore_region(self.background, bbox=region)
+        self.fig.draw_artist(self.timing)
+        canvas.blit(region)
+        canvas.flush_events()
+
+
+if __name__ == "__main__":
+    # 사용법: python interactive.py [korea_rental_housing.csv 경로]
+    data_path = sys.argv[1] if len(sys.argv) > 1 else "korea_rental_housing.csv"
+    explorer = Explorer(data_path if os.path.exists(data_path) else None)
+    plt.show()
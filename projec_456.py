@@ -2,6 +2,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 from scipy.stats import norm, t, f
 
+from results_store import ResultsStore, interval_record
+
+results_path = "results"   # 구간 추정 결과를 모아두는 컬럼형 저장소 경로
+
 ##################
 # start: project3
 np.random.seed(42)  #시드 설정으로 재현가능하게 
@@ -123,3 +127,21 @@ ci_upper = ratio_var * f_critical2
 print(f"Sample variance1: {S1}")
 print(f"Sample variance2: {S2}")
 print(f"95% confidence interval for σ1²/σ2²: P({ci_lower:.4f} < σ1²/σ2² < {ci_upper:.4f})")
+
+##################
+# start: results store
+results = [
+    interval_record("projec_456", "mean_diff_known_var", mean_diff,
+                    lower_bound_known_var, upper_bound_known_var, confidence_level, n1, n2),
+    interval_record("projec_456", "mean_diff_equal_unknown_var", mean_diff,
+                    lower_bound_equal_unknown_var, upper_bound_equal_unknown_var, confidence_level, n1, n2,
+                    df=n1 + n2 - 2),
+    interval_record("projec_456", "mean_diff_unknown_var", mean_diff,
+                    lower_bound_unknown_var, upper_bound_unknown_var, confidence_level, n1, n2,
+                    df=degrees_of_freedom),
+    interval_record("projec_456", "variance_ratio", ratio_var, ci_lower, ci_upper, 1 - alpha, n1, n2,
+                    df=v_1, df2=v_2),
+]
+ResultsStore(results_path).append(results)
+# end: results store
+##################
@@ -1,17 +1,29 @@
-import pandas as pd
+import sys
+
 import matplotlib.pyplot as plt
 import numpy as np
 import scipy.stats as stats
 
-pd.options.display.float_format = '{:,.0f}'.format
+from quantile_ci import grouped_quantile_ci, quantile_ci
+from rental_loader import load_rents
+from weighted_population import WeightedPopulation
 
-df = pd.read_csv(r".\korea_rental_housing.csv", encoding="cp949")
-#다운로드 한 데이터를 절대경로를 이용해 가져옴
+data_path = sys.argv[1] if len(sys.argv) > 1 else "korea_rental_housing.csv"   # 데이터 경로는 인자로 받음
 
-df_seoul = df[df['광역시도'] == '서울특별시']      #전국의 지역 중 서울특별시
+# 광역시도/월임대료 두 컬럼만 한 번 읽음 (전국, 결측 제외)
+provinces, rents = load_rents(data_path, provinces=None, return_provinces=True)
 
 sample_sizes = [10, 30, 100]   # 요구된 샘플 크기들
-population = df_seoul['월임대료'].dropna().astype(float).values  # 모집단 (서울 월임대료)
+population = rents[provinces == '서울특별시']  # 모집단 (서울 월임대료)
+
+# 모수(참값)는 고유값/개수로 압축한 모집단에서 가중 연산으로 계산
+rent_population = WeightedPopulation.from_values(population)
+true_mean = rent_population.mean()
+true_var = rent_population.var(ddof=0)
+true_median = rent_population.quantile(0.5)
+print(f"모집단 크기: {rent_population.size:,} (고유값 {rent_population.values.size:,}개)")
+print(f"모평균 (μ): {true_mean:,.2f}, 모분산 (σ²): {true_var:,.2f}, 모중앙값: {true_median:,.2f}")
+
 alpha = 0.01  # 99% 신뢰수준 → 유의수준 1%
 
 for size in sample_sizes:
@@ -36,6 +48,9 @@ for size in sample_sizes:
     pred_margin = t_crit * sample_std * np.sqrt(1 + 1 / size)
     prediction_interval = (sample_mean - pred_margin, sample_mean + pred_margin)
 
+    # 중앙값에 대한 99% 신뢰구간 (순서통계량, 분포 가정 없음) — 월임대료는 오른쪽으로 치우쳐 있음
+    ci_median = quantile_ci(sample, 0.5, alpha)
+
     # 실제 관측값 하나와 비교 (무작위로 하나 선택)
     actual_value = np.random.choice(population, 1)[0]
     in_interval = prediction_interval[0] <= actual_value <= prediction_interval[1]
@@ -46,5 +61,19 @@ for size in sample_sizes:
     print(f"표본분산 (S²): {sample_var:,.2f}")
     print(f"99% 신뢰구간 (모평균): ({ci_mean[0]:,.2f}, {ci_mean[1]:,.2f})")
     print(f"99% 신뢰구간 (모분산): ({ci_var[0]:,.2f}, {ci_var[1]:,.2f})")
+    print(f"99% 신뢰구간 (중앙값): ({ci_median['lower']:,.2f}, {ci_median['upper']:,.2f})"
+          f" (실제 포함확률 {ci_median['coverage']:.4f})")
     print(f"99% 예측구간 (향후 관측값): ({prediction_interval[0]:,.2f}, {prediction_interval[1]:,.2f})")
-    print(f"실제 관측값: {actual_value:,.2f} → 예측구간 내 포함 여부: {in_interval}")
\ No newline at end of file
+    print(f"실제 관측값: {actual_value:,.2f} → 예측구간 내 포함 여부: {in_interval}")
+    print(f"참값 포함 여부 — 모평균: {ci_mean[0] <= true_mean <= ci_mean[1]}, "
+          f"모분산: {ci_var[0] <= true_var <= ci_var[1]}, "
+          f"중앙값: {ci_median['lower'] <= true_median <= ci_median['upper']}")
+
+# 서울 외 광역시도별, 샘플 크기별 중앙값 99% 신뢰구간 (데이터는 한 번만 훑음, None = 지역 전체)
+# 위 반복문과는 별개의 난수로 표본을 뽑으므로, 같은 n 의 서울 결과와 겹치지 않게 서울은 뺀다
+others = provinces != '서울특별시'
+print("\n== 광역시도별 중앙값 99% 신뢰구간 (서울 제외, 독립 표본) ==")
+for row in grouped_quantile_ci(provinces[others], rents[others], q=0.5, alpha=alpha,
+                               sample_sizes=sample_sizes + [None]):
+    print(f"{row['group']} (n={row['n']}): 중앙값 {row['estimate']:,.2f}, "
+          f"({row['lower']:,.2f}, {row['upper']:,.2f}), 포함확률 {row['coverage']:.4f}")
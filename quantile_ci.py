@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+from scipy.stats import binom
+
+
+def order_statistic_ranks(n, q, alpha):
+    """분위수 q에 대한 (1 - alpha) 신뢰구간의 순서통계량 순위 (1부터 시작).
+
+    B ~ Bin(n, q) 일 때 P(X(l) <= ξq < X(u)) = P(l <= B < u) 이므로
+    l, u 를 이항분포의 alpha/2, 1 - alpha/2 분위수로 잡는다 (분포 가정 없음).
+    표본이 너무 작아 순위가 1..n 을 벗어나면 양 끝으로 자르며, 이때 실제
+    포함확률(coverage)은 1 - alpha 보다 작아진다.
+    """
+    q = np.asarray(q, dtype=float)
+    lower = np.maximum(binom.ppf(alpha / 2, n, q).astype(int), 1)
+    upper = np.minimum(binom.ppf(1 - alpha / 2, n, q).astype(int) + 1, n)
+    coverage = binom.cdf(upper - 1, n, q) - binom.cdf(lower - 1, n, q)
+    return lower, upper, coverage
+
+
+def quantile_ci(values, q=0.5, alpha=0.01):
+    """중앙값/분위수의 순서통계량 신뢰구간.
+
+    전체 정렬 대신 필요한 순위만 np.partition 으로 한 번에 골라낸다.
+    반환값: dict(estimate, lower, upper, coverage) — q 가 배열이면 각 항목도 배열.
+    """
+    values = np.asarray(values, dtype=float)
+    n = values.size
+    lower, upper, coverage = order_statistic_ranks(n, q, alpha)
+    point = np.clip(np.ceil(n * np.asarray(q, dtype=float)).astype(int), 1, n)  # 경험분포의 역함수
+
+    kth = np.unique(np.concatenate([np.ravel(lower), np.ravel(upper), np.ravel(point)]) - 1)
+    selected = np.partition(values, kth)
+    return {"estimate": selected[point - 1], "lower": selected[lower - 1],
+            "upper": selected[upper - 1], "coverage": coverage}
+
+
+def grouped_quantile_ci(groups, values, q=0.5, alpha=0.01, sample_sizes=(None,), seed=42):
+    """그룹(예: 광역시도)별, 표본 크기별 분위수 신뢰구간을 한 번에 계산한다.
+
+    데이터는 그룹 코드로 한 번만 훑어 안정 정렬로 묶고, 각 그룹은 그 배열의 구간(view)으로
+    다룬다. sample_sizes 의 None 은 그룹 전체를 뜻하며, 그룹보다 큰 표본 크기는 건너뛴다.
+    반환값: 그룹/표본크기/분위수마다 한 줄씩인 dict 리스트.
+    """
+    # 그룹 라벨은 문자열 배열로 바꾸지 않고 그대로 코드화한다 (라벨이 결측인 행은 -1)
+    codes, names = pd.factorize(np.asarray(groups, dtype=object), sort=True)
+    values = np.asarray(values, dtype=float)
+    keep = ~np.isnan(values) & (codes >= 0)
+    codes, values = codes[keep], values[keep]
+
+    order = np.argsort(codes, kind="stable")
+    grouped = values[order]
+    bounds = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=names.size))])
+
+    rng = np.random.default_rng(seed)
+    qs = np.atleast_1d(np.asarray(q, dtype=float))
+    rows = []
+    for name, start, end in zip(names, bounds[:-1], bounds[1:]):
+        block = grouped[start:end]
+        for size in sample_sizes:
+            if size is None:
+                sample = block
+            elif size <= block.size:
+                sample = rng.choice(block, size=size, replace=False)
+            else:
+                continue
+            ci = quantile_ci(sample, qs, alpha)
+            for i, quantile in enumerate(qs):
+                rows.append({"group": name, "n": sample.size, "q": quantile,
+                             "estimate": ci["estimate"][i], "lower": ci["lower"][i],
+                             "upper": ci["upper"][i], "coverage": ci["coverage"][i]})
+    return rows
@@ -0,0 +1,116 @@
+import csv
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+PROVINCE_COLUMN = "광역시도"
+RENT_COLUMN = "월임대료"
+
+
+def _block_bounds(buffer, start, n_blocks):
+    """[start, len) 구간을 줄바꿈 위치에서 끊어 n_blocks 개 정도의 블록 경계로 나눈다.
+
+    cp949 의 두 번째 바이트는 0x41 이상이므로 b'\\n' 은 항상 실제 줄바꿈이다.
+    (따옴표 안에 줄바꿈이 들어간 필드는 없다고 가정한다.)
+    """
+    step = max((len(buffer) - start) // n_blocks, 1)
+    bounds = [start]
+    while bounds[-1] + step < len(buffer):
+        newline = buffer.find(b"\n", bounds[-1] + step)
+        if newline < 0:
+            break
+        bounds.append(newline + 1)
+    if bounds[-1] < len(buffer):
+        bounds.append(len(buffer))
+    return bounds
+
+
+def _matching_lines(block, patterns):
+    """patterns 중 하나라도 들어 있는 줄만 원래 순서대로 이어 붙인다.
+
+    줄마다 검사하지 않고 bytes.find 로 일치 위치만 찾아가므로, 반복 횟수는 남길 줄 수에 비례한다.
+    """
+    spans = set()
+    for pattern in patterns:
+        position = block.find(pattern)
+        while position >= 0:
+            line_start = block.rfind(b"\n", 0, position) + 1
+            line_end = block.find(b"\n", position)
+            line_end = len(block) if line_end < 0 else line_end
+            spans.add((line_start, line_end))
+            position = block.find(pattern, line_end)
+    return b"\n".join(block[line_start:line_end] for line_start, line_end in sorted(spans))
+
+
+def _parse_range(path, start, end, names, provinces):
+    """파일의 [start, end) 바이트 구간에서 (광역시도, 월임대료) 배열을 뽑는다.
+
+    provinces 가 있으면 cp949 로 인코딩한 지역명이 들어 있는 줄만 바이트 상태로 남기고,
+    남은 줄만 디코딩한다. 바이트 부분일치는 다른 컬럼에서 걸릴 수도 있으므로 파싱 뒤에
+    광역시도 컬럼으로 한 번 더 거른다. 디코딩한 결과는 utf-8 로 넘겨 pandas 의 C 파서가
+    바로 읽게 한다 (다른 인코딩을 주면 pandas 가 파이썬 쪽에서 다시 디코딩한다).
+    provinces=None 이면 거를 줄이 없으므로 블록을 그대로 cp949 로 파싱한다.
+    """
+    with open(path, "rb") as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        block = buffer[start:end]
+    if provinces is None:
+        source, encoding = block, "cp949"
+    else:
+        block = _matching_lines(block, [province.encode("cp949") for province in provinces])
+        source, encoding = block.decode("cp949").encode("utf-8"), "utf-8"
+    if not block.strip():
+        return np.array([], dtype=object), np.array([], dtype=float)
+
+    frame = pd.read_csv(io.BytesIO(source), encoding=encoding, header=None, names=names,
+                        usecols=[PROVINCE_COLUMN, RENT_COLUMN], engine="c")
+    if provinces is not None:
+        frame = frame[frame[PROVINCE_COLUMN].isin(provinces)]
+    # 지역명은 고정폭 문자열로 바꾸지 않고 object 배열로 둔다 (행이 많으면 변환 비용이 큼)
+    return (frame[PROVINCE_COLUMN].to_numpy(dtype=object),
+            pd.to_numeric(frame[RENT_COLUMN], errors="coerce").to_numpy(dtype=float))
+
+
+def load_rents(path, provinces=("서울특별시",), n_workers=1, use_processes=False,
+               return_provinces=False, dropna=True):
+    """korea_rental_housing.csv 에서 월임대료 배열을 읽는다.
+
+    파일을 줄 단위 바이트 구간으로 나누고, 구간마다 필요한 지역의 줄만 cp949 디코딩해서
+    광역시도/월임대료 두 컬럼만 파싱한다 (provinces=None 이면 전국).
+    n_workers 가 2 이상이면 구간들을 여러 스레드가 나눠 처리한다 (n_workers=None 이면 CPU 수).
+    use_processes=True 이면 스레드 대신 프로세스를 쓰고(플랫폼 기본 시작 방식), 각 프로세스는
+    파일을 직접 열어 거른 배열만 돌려준다.
+    return_provinces=True 이면 (광역시도 배열, 월임대료 배열)을 돌려준다.
+    """
+    provinces = None if provinces is None else list(provinces)
+    n_workers = n_workers or os.cpu_count() or 1
+
+    if os.path.getsize(path) == 0:
+        parts = []
+    else:
+        with open(path, "rb") as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            header_end = buffer.find(b"\n") + 1 or len(buffer)
+            names = next(csv.reader([buffer[:header_end].decode("cp949").strip("\r\n")]))
+            # 작업자당 4블록 — 부하 분산용 (작업자가 하나면 나눌 필요 없음)
+            bounds = _block_bounds(buffer, header_end, 1 if n_workers == 1 else n_workers * 4)
+        spans = list(zip(bounds[:-1], bounds[1:]))
+        if n_workers == 1:
+            parts = [_parse_range(path, start, end, names, provinces) for start, end in spans]
+        else:
+            executor = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+            with executor(max_workers=n_workers) as pool:
+                parts = list(pool.map(_parse_range, [path] * len(spans), *zip(*spans),
+                                      [names] * len(spans), [provinces] * len(spans)))
+
+    if parts:
+        regions = np.concatenate([region for region, _ in parts])
+        rents = np.concatenate([rent for _, rent in parts])
+    else:
+        regions, rents = np.array([], dtype=object), np.array([], dtype=float)
+    if dropna:
+        keep = ~np.isnan(rents)
+        regions, rents = regions[keep], rents[keep]
+    return (regions, rents) if return_provinces else rents
@@ -0,0 +1,129 @@
+import csv
+import json
+import os
+import shutil
+import time
+import uuid
+
+import numpy as np
+
+# 결과 레코드의 컬럼 구성 (이름, 결측값)
+# kind: 'interval'(신뢰구간) / 'test'(검정 통계량) / 'simulation'(시뮬레이션 요약)
+COLUMNS = (
+    ("script", ""),
+    ("kind", ""),
+    ("name", ""),
+    ("n1", -1),
+    ("n2", -1),
+    ("level", np.nan),
+    ("estimate", np.nan),
+    ("lower", np.nan),
+    ("upper", np.nan),
+    ("statistic", np.nan),
+    ("df", np.nan),
+    ("df2", np.nan),      # F 분포처럼 자유도가 두 개인 경우의 두 번째 자유도
+    ("p_value", np.nan),
+    ("std", np.nan),
+    ("reps", -1),
+)
+COLUMN_NAMES = tuple(name for name, _ in COLUMNS)
+_MISSING = dict(COLUMNS)
+_DTYPES = {name: (str if isinstance(missing, str) else int if isinstance(missing, int) else float)
+           for name, missing in COLUMNS}
+
+
+def _is_missing(name, value):
+    missing = _MISSING[name]
+    if isinstance(missing, float):
+        return np.isnan(value)
+    return value == missing
+
+
+def interval_record(script, name, estimate, lower, upper, level, n1, n2=-1, df=np.nan, df2=np.nan):
+    """신뢰구간/예측구간 하나를 레코드로 만든다."""
+    return {"script": script, "kind": "interval", "name": name, "n1": n1, "n2": n2,
+            "level": level, "estimate": estimate, "lower": lower, "upper": upper, "df": df, "df2": df2}
+
+
+def test_record(script, name, statistic, p_value, n1, n2=-1, df=np.nan, df2=np.nan):
+    """검정 통계량과 p-value를 레코드로 만든다."""
+    return {"script": script, "kind": "test", "name": name, "n1": n1, "n2": n2,
+            "statistic": statistic, "df": df, "df2": df2, "p_value": p_value}
+
+
+def simulation_record(script, name, values, n1, n2=-1):
+    """시뮬레이션으로 얻은 통계량 배열을 평균/표준편차/반복횟수로 요약한다."""
+    values = np.asarray(values, dtype=float)
+    return {"script": script, "kind": "simulation", "name": name, "n1": n1, "n2": n2,
+            "estimate": values.mean(), "std": values.std(ddof=1), "reps": values.size}
+
+
+class ResultsStore:
+    """추가 전용(append-only) 컬럼형 결과 저장소.
+
+    append() 한 번이 청크 디렉터리 하나가 되고, 청크 안에는 컬럼마다 .npy 파일이
+    하나씩 들어간다. 청크는 임시 이름으로 쓴 뒤 rename 으로 공개하므로 여러 프로세스가
+    동시에 append 해도 서로의 청크를 덮어쓰거나 반쯤 쓰인 청크를 읽지 않는다.
+    컬럼 하나를 읽을 때는 각 청크에서 해당 .npy 파일만 연다.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def append(self, records):
+        """레코드(dict) 묶음을 청크 하나로 기록하고 청크 이름을 돌려준다."""
+        records = list(records)
+        if not records:
+            return None
+        unknown = set().union(*records) - set(COLUMN_NAMES)
+        if unknown:
+            raise ValueError(f"unknown result columns: {sorted(unknown)}")
+
+        chunk = f"{time.time_ns():020d}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        staging = os.path.join(self.root, "." + chunk)
+        os.makedirs(staging)
+        try:
+            for name in COLUMN_NAMES:
+                kind = _DTYPES[name]
+                values = [kind(record.get(name, _MISSING[name])) for record in records]
+                np.save(os.path.join(staging, name + ".npy"), np.array(values, dtype=kind))
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)  # 반쯤 쓴 임시 청크를 남기지 않는다
+            raise
+        os.rename(staging, os.path.join(self.root, chunk))
+        return chunk
+
+    def chunks(self):
+        return sorted(entry for entry in os.listdir(self.root)
+                      if not entry.startswith(".") and os.path.isdir(os.path.join(self.root, entry)))
+
+    def column(self, name):
+        """컬럼 하나를 전체 청크에 걸쳐 읽는다 (다른 컬럼 파일은 열지 않음)."""
+        if name not in _MISSING:
+            raise KeyError(name)
+        parts = [np.load(os.path.join(self.root, chunk, name + ".npy")) for chunk in self.chunks()]
+        if not parts:
+            return np.array([], dtype=_DTYPES[name])
+        return np.concatenate(parts)
+
+    def read(self, columns=None):
+        return {name: self.column(name) for name in (columns or COLUMN_NAMES)}
+
+    def _rows(self, columns):
+        """내보내기용 행 — 결측값(빈 문자열, -1, NaN)은 모두 None 으로 바꾼다."""
+        table = self.read(columns)
+        names = list(table)
+        for values in zip(*(table[name].tolist() for name in names)):
+            yield {name: (None if _is_missing(name, value) else value) for name, value in zip(names, values)}
+
+    def to_csv(self, path, columns=None):
+        columns = list(columns or COLUMN_NAMES)
+        with open(path, "w", newline="", encoding="utf-8") as fp:
+            writer = csv.DictWriter(fp, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(self._rows(columns))
+
+    def to_json(self, path, columns=None):
+        with open(path, "w", encoding="utf-8") as fp:
+            json.dump(list(self._rows(columns)), fp, ensure_ascii=False, indent=2)
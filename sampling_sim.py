@@ -0,0 +1,47 @@
+from collections import namedtuple
+
+import numpy as np
+from scipy import stats
+
+# 정규 모집단 선언 — simulate_mean_var 에 넘기면 해석적(analytic) 경로가 자동으로 선택된다
+NormalModel = namedtuple("NormalModel", ["mu", "sigma"])
+
+
+def simulate_mean_var(population, n, reps, rng=None, replace=False, analytic=None):
+    """크기 n 인 표본을 reps 번 뽑았을 때의 (표본평균 배열, 표본분산 배열).
+
+    population 이 NormalModel 이면 기본으로 해석적 경로를 쓴다: 정규 표본에서
+    X̄ ~ N(μ, σ²/n), (n-1)S²/σ² ~ χ²(n-1) 이고 둘은 독립이므로 원자료 n 개를 뽑지 않고
+    반복마다 O(1)로 두 통계량을 바로 뽑는다. analytic=False 로 두면 정규분포에서 원자료를
+    직접 뽑는다. population 이 배열이면 그 유한 모집단에서 표본을 뽑는다 (replace 로 복원 여부).
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    if isinstance(population, NormalModel):
+        if analytic is None or analytic:
+            means = rng.normal(population.mu, population.sigma / np.sqrt(n), reps)
+            variances = population.sigma ** 2 * rng.chisquare(n - 1, reps) / (n - 1)
+            return means, variances
+        samples = rng.normal(population.mu, population.sigma, (reps, n))
+    elif analytic:
+        raise ValueError("analytic simulation needs a NormalModel population")
+    else:
+        samples = np.stack([rng.choice(population, n, replace=replace) for _ in range(reps)])
+    return samples.mean(axis=1), samples.var(axis=1, ddof=1)
+
+
+def check_analytic_path(model=NormalModel(50, 10), n=81, reps=20000, seed=0):
+    """해석적 경로와 원자료 추출 경로의 표본평균/표본분산 분포를 2표본 KS 검정으로 비교한다.
+
+    반환값: {'mean': p-value, 'var': p-value} — 두 경로가 같은 분포라면 p-value 가 작지 않아야 한다.
+    """
+    rng = np.random.default_rng(seed)
+    fast_means, fast_vars = simulate_mean_var(model, n, reps, rng)
+    raw_means, raw_vars = simulate_mean_var(model, n, reps, rng, analytic=False)
+    return {"mean": stats.ks_2samp(fast_means, raw_means).pvalue,
+            "var": stats.ks_2samp(fast_vars, raw_vars).pvalue}
+
+
+if __name__ == "__main__":
+    for n in (81, 101):
+        p_values = check_analytic_path(n=n)
+        print(f"n = {n}: KS p-value (mean) = {p_values['mean']:.4f}, (variance) = {p_values['var']:.4f}")
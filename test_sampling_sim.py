@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from sampling_sim import NormalModel, check_analytic_path, simulate_mean_var
+
+
+@pytest.mark.parametrize("n", [81, 101])
+def test_analytic_matches_raw(n):
+    p_values = check_analytic_path(NormalModel(50, 10), n=n, reps=20000, seed=0)
+    assert min(p_values.values()) > 0.001
+
+
+def test_normal_model_selects_analytic_path():
+    # 해석적 경로는 원자료를 뽑지 않으므로 같은 시드라도 원자료 경로와 결과가 다르다
+    model = NormalModel(50, 10)
+    fast = simulate_mean_var(model, 81, 100, np.random.default_rng(1))
+    raw = simulate_mean_var(model, 81, 100, np.random.default_rng(1), analytic=False)
+    assert not np.allclose(fast[0], raw[0])
+    assert np.allclose(fast[0], simulate_mean_var(model, 81, 100, np.random.default_rng(1), analytic=True)[0])
+
+
+def test_analytic_requires_normal_model():
+    with pytest.raises(ValueError):
+        simulate_mean_var(np.arange(100.0), 10, 5, np.random.default_rng(0), analytic=True)
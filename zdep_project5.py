@@ -3,6 +3,9 @@ import matplotlib.pyplot as plt
 from scipy import stats
 import seaborn as sns
 
+from results_store import ResultsStore, interval_record, simulation_record, test_record
+from sampling_sim import NormalModel, simulate_mean_var
+
 # Font settings for plots
 plt.style.use('default')
 plt.rcParams['axes.unicode_minus'] = False
@@ -19,6 +22,9 @@ np.random.seed(42)
 # Generate two normal distribution populations
 population1 = np.random.normal(mu1, sigma, n_samples)
 population2 = np.random.normal(mu2, sigma, n_samples)
+# Declared population models (normal) - lets the simulation use the analytic fast path
+population_model1 = NormalModel(mu1, sigma)
+population_model2 = NormalModel(mu2, sigma)
 
 print("=== POPULATION INFORMATION ===")
 print(f"Population 1: Mean = {np.mean(population1):.2f}, Std = {np.std(population1):.2f}")
@@ -27,6 +33,7 @@ print(f"True difference (μ₂ - μ₁) = {true_diff}")
 
 # Sample sizes
 n1, n2 = 81, 101
+results_path = "results"  # Columnar store for intervals, tests and simulation summaries
 
 # Random sampling from populations
 np.random.seed(123)  # Different seed for sampling
@@ -135,12 +142,11 @@ ax2.grid(True, alpha=0.3)
 
 # Plot 3: Sampling distribution simulation
 n_simulations = 1000
-sample_diffs = []
-
-for _ in range(n_simulations):
-    sim_sample1 = np.random.choice(population1, n1, replace=False)
-    sim_sample2 = np.random.choice(population2, n2, replace=False)
-    sample_diffs.append(np.mean(sim_sample2) - np.mean(sim_sample1))
+sim_rng = np.random.default_rng(123)
+# Normal models: sample means are drawn directly from N(μ, σ²/n), O(1) per replicate
+sim_means1, _ = simulate_mean_var(population_model1, n1, n_simulations, sim_rng)
+sim_means2, _ = simulate_mean_var(population_model2, n2, n_simulations, sim_rng)
+sample_diffs = sim_means2 - sim_means1
 
 theoretical_se = sigma * np.sqrt(1/n1 + 1/n2)
 theoretical_mean = true_diff
@@ -215,4 +221,21 @@ print(f"\n=== SUMMARY ===")
 print(f"All three confidence intervals contain the true difference ({true_diff}):")
 print(f"- Known variance method gives the narrowest interval")
 print(f"- Welch's t-test is most conservative when variances might be unequal")
-print(f"- Sample difference ({sample_mean_diff:.3f}) is close to true difference ({true_diff})")
\ No newline at end of file
+print(f"- Sample difference ({sample_mean_diff:.3f}) is close to true difference ({true_diff})")
+
+# Store every interval, test statistic and simulation summary as typed records
+results = [
+    interval_record("zdep_project5", "mean_diff_known_var", sample_mean_diff,
+                    ci_known_lower, ci_known_upper, 1 - alpha, n1, n2),
+    interval_record("zdep_project5", "mean_diff_pooled", sample_mean_diff,
+                    ci_pooled_lower, ci_pooled_upper, 1 - alpha, n1, n2, df=n1+n2-2),
+    interval_record("zdep_project5", "mean_diff_welch", sample_mean_diff,
+                    ci_welch_lower, ci_welch_upper, 1 - alpha, n1, n2, df=df_welch),
+    test_record("zdep_project5", "t_test_pooled", t_stat_pooled, p_value_pooled, n1, n2, df=n1+n2-2),
+    test_record("zdep_project5", "t_test_welch", t_stat_welch, p_value_welch, n1, n2, df=df_welch),
+    test_record("zdep_project5", "f_test_equal_var", f_stat, p_value_f, n1, n2,
+                df=n2-1 if sample_std2 > sample_std1 else n1-1,
+                df2=n1-1 if sample_std2 > sample_std1 else n2-1),
+    simulation_record("zdep_project5", "mean_diff_sampling", sample_diffs, n1, n2),
+]
+ResultsStore(results_path).append(results)
@@ -3,6 +3,9 @@ import matplotlib.pyplot as plt
 from scipy import stats
 import seaborn as sns
 
+from results_store import ResultsStore, interval_record, simulation_record, test_record
+from sampling_sim import NormalModel, simulate_mean_var
+
 # Font settings for plots
 plt.style.use('default')
 plt.rcParams['axes.unicode_minus'] = False
@@ -19,6 +22,9 @@ np.random.seed(42)
 # Generate two normal distribution populations
 population1 = np.random.normal(mu1, sigma1, n_samples)
 population2 = np.random.normal(mu2, sigma2, n_samples)
+# Declared population models (normal) - lets the simulation use the analytic fast path
+population_model1 = NormalModel(mu1, sigma1)
+population_model2 = NormalModel(mu2, sigma2)
 
 print("=== POPULATION INFORMATION ===")
 print(f"Population 1: Mean = {np.mean(population1):.2f}, Std = {np.std(population1):.2f}")
@@ -27,6 +33,7 @@ print(f"True variance ratio (σ₁²/σ₂²) = {sigma1**2}/{sigma2**2} = {true_
 
 # Sample sizes
 n1, n2 = 81, 101
+results_path = "results"  # Columnar store for intervals, tests and simulation summaries
 
 # Random sampling from populations
 np.random.seed(123)  # Different seed for sampling
@@ -135,15 +142,11 @@ ax2.set_xlim(0, 3)
 
 # Plot 3: Simulation of sampling distribution of variance ratio
 n_simulations = 1000
-variance_ratios = []
-
-np.random.seed(456)
-for _ in range(n_simulations):
-    sim_sample1 = np.random.choice(population1, n1, replace=False)
-    sim_sample2 = np.random.choice(population2, n2, replace=False)
-    sim_var1 = np.var(sim_sample1, ddof=1)
-    sim_var2 = np.var(sim_sample2, ddof=1)
-    variance_ratios.append(sim_var1 / sim_var2)
+sim_rng = np.random.default_rng(456)
+# Normal models: sample variances are drawn directly from σ²·χ²(n-1)/(n-1), O(1) per replicate
+_, sim_vars1 = simulate_mean_var(population_model1, n1, n_simulations, sim_rng)
+_, sim_vars2 = simulate_mean_var(population_model2, n2, n_simulations, sim_rng)
+variance_ratios = sim_vars1 / sim_vars2
 
 ax3.hist(variance_ratios, bins=30, alpha=0.7, density=True, color='lightgreen', 
          label=f'Simulated Sampling Distribution\n(n={n_simulations} samples)')
@@ -240,4 +243,18 @@ if abs(true_variance_ratio - 1.0) < 0.001:  # If variances are approximately equ
     if ci_lower <= 1.0 <= ci_upper:
         print(f"Since 1.0 is within our confidence interval, we cannot reject the hypothesis of equal variances.")
     else:
-        print(f"Since 1.0 is not within our confidence interval, we reject the hypothesis of equal variances.")
\ No newline at end of file
+        print(f"Since 1.0 is not within our confidence interval, we reject the hypothesis of equal variances.")
+
+# Store every interval, test statistic and simulation summary as typed records
+results = [
+    interval_record("zdep_project6", "variance_ratio", sample_variance_ratio,
+                    ci_lower, ci_upper, 1 - alpha, n1, n2, df=df1, df2=df2),
+    interval_record("zdep_project6", "variance1", sample_var1,
+                    var1_ci_lower, var1_ci_upper, 1 - alpha, n1, df=df1),
+    interval_record("zdep_project6", "variance2", sample_var2,
+                    var2_ci_lower, var2_ci_upper, 1 - alpha, n2, df=df2),
+    test_record("zdep_project6", "f_test_equal_var", f_statistic, p_value_f_test, n1, n2,
+                df=df_num, df2=df_den),
+    simulation_record("zdep_project6", "variance_ratio_sampling", variance_ratios, n1, n2),
+]
+ResultsStore(results_path).append(results)